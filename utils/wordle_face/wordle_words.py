@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+# Helper for building the word list of a wordle-style watch face.
+# txt_of_all_letter_combos() scores every combination of letters, writes the
+# full ranking to output.txt, and prints a C array initializer (paste into the
+# face's header) for the words spellable from the best combination.
+# Only what module init needs is imported here; single-caller modules
+# (random, itertools, time, ast, hashlib, Counter) are imported inside the
+# functions that use them to keep baseline import cost down.
+import mmap
+import os
+import sys
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # optional; everything below falls back to pure Python
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+    def prange(n):
+        return range(n)
+
+WORDLE_LENGTH = 5
+
+# Letters are integers 0-25 internally; chr(65 + i) only at output boundaries.
+
+# The corpus lives in words.txt, one word per line.  words.bin is a derived
+# 5*N ASCII blob (regenerated whenever words.txt is newer) that gets memory-
+# mapped below, so the data-loading cost at import is a single mmap and the
+# kernel shares one copy of the pages across processes.
+_TXT_PATH = os.path.join(os.path.dirname(__file__), "words.txt")
+_BIN_PATH = os.path.join(os.path.dirname(__file__), "words.bin")
+
+if (not os.path.exists(_BIN_PATH)
+        or os.path.getmtime(_BIN_PATH) < os.path.getmtime(_TXT_PATH)):
+    # Uppercase the whole corpus here, once, so nothing downstream ever
+    # calls .upper() on a word again; only caller-supplied letters still
+    # get normalized (once per call, at function entry).
+    with open(_TXT_PATH) as _f:
+        _words = _f.read().upper().split()
+    # Dedup once here (order-preserving) so no consumer ever needs a
+    # quadratic already-seen scan while collecting words.
+    _words = list(dict.fromkeys(_words))
+    # Keep the most promising words first: score each by the summed
+    # corpus-wide frequency of its distinct letters, so best-first scans can
+    # stop as soon as the running bound beats anything the tail could score.
+    # Everything derived from the blob inherits this order.
+    _counts = [0] * 26
+    for _word in _words:
+        for _char in _word:
+            _counts[ord(_char) - 65] += 1
+    _words.sort(key=lambda w: -sum(_counts[ord(c) - 65] for c in set(w)))
+    with open(_BIN_PATH, "wb") as _f:
+        _f.write(b"".join(word.encode("ascii") for word in _words))
+    del _counts, _words
+
+# All words packed into one contiguous ASCII buffer, 5 bytes per word.  Full
+# scans walk ~28 KB of sequential memory instead of chasing ~5000 separate
+# str objects.
+_BIN_FILE = open(_BIN_PATH, "rb")
+WORD_BUF = mmap.mmap(_BIN_FILE.fileno(), 0, access=mmap.ACCESS_READ)
+N_WORDS = len(WORD_BUF) // WORDLE_LENGTH
+
+# Interned so equality checks and dict probes on words hit the
+# pointer-identity fast path before comparing content.
+words = tuple(sys.intern(WORD_BUF[WORDLE_LENGTH * i:WORDLE_LENGTH * (i + 1)].decode("ascii"))
+              for i in range(N_WORDS))
+
+# Typed stdlib view of the buffer: subscripting an array('B') yields a plain
+# int with no per-access page-protection hop through the mapping, and it
+# needs no numpy.  This is what the pure-Python letter loops index.
+LETTERS = array("B")
+LETTERS.frombytes(WORD_BUF)
+
+# Hash-based membership: one probe instead of a linear scan over ~5000 strings.
+WORDS_SET = frozenset(words)
+
+# O(1) reverse lookup into the index-aligned arrays (WORDS_U32, the pattern
+# table, ...) instead of words.index() scans.
+WORD_INDEX = {word: i for i, word in enumerate(words)}
+
+# 26-bit letter-present mask per word as plain ints; WORDS_LETTERMASK below
+# is the numpy mirror.
+WORD_MASKS = tuple(sum(1 << (ord(c) - 65) for c in set(word)) for word in words)
+
+if np is not None:
+    # Zero-copy uint8 view of the buffer for vectorized passes.
+    _ARR = np.frombuffer(WORD_BUF, dtype=np.uint8)
+    # Each word packed into one uint32, 5 bits per letter (0-25) with letter 0
+    # in the low bits, plus a 26-bit "letter appears in word" mask.  Word
+    # compares and contains-letter tests become single integer ops.
+    WORDS_U32 = np.array(
+        [sum((ord(c) - 65) << (5 * i) for i, c in enumerate(word)) for word in words],
+        dtype=np.uint32)
+    WORDS_LETTERMASK = np.array(WORD_MASKS, dtype=np.uint32)
+    # Per-word letter-frequency score in int16 (the sum of five letter counts
+    # tops out around 10k, well inside the range).  Solver argmax/argsort
+    # passes touch a quarter of the memory a float64 array would.
+    _FREQ = np.bincount(_ARR, minlength=91)[65:91]
+    SCORES_I16 = np.array(
+        [sum(int(_FREQ[ord(c) - 65]) for c in set(word)) for word in words],
+        dtype=np.int16)
+
+
+def _build_trie():
+    # Five-level array trie over letter-at-position: children[node][c] is the
+    # child index or -1, node 0 is the root, and nodes at depth WORDLE_LENGTH
+    # are leaves whose entry in leaf_word is the word index.
+    children = [[-1] * 26]
+    leaf_word = [-1]
+    for i in range(N_WORDS):
+        node = 0
+        for k in range(WORDLE_LENGTH):
+            c = WORD_BUF[WORDLE_LENGTH * i + k] - 65
+            child = children[node][c]
+            if child < 0:
+                child = len(children)
+                children[node][c] = child
+                children.append([-1] * 26)
+                leaf_word.append(-1)
+            node = child
+        leaf_word[node] = i
+    if np is not None:
+        return np.array(children, dtype=np.int32), np.array(leaf_word, dtype=np.int32)
+    return children, leaf_word
+
+
+TRIE_CHILDREN, TRIE_LEAF = _build_trie()
+
+
+def words_matching_greens(greens):
+    # Word indices whose letters match greens, a dict of position -> letter.
+    # Each fixed position is one array index; only wildcard positions fan out.
+    greens = {pos: ord(c.upper()) - 65 for pos, c in greens.items()}
+    matches = []
+    stack = [(0, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if depth == WORDLE_LENGTH:
+            matches.append(int(TRIE_LEAF[node]))
+            continue
+        row = TRIE_CHILDREN[node]
+        if depth in greens:
+            child = row[greens[depth]]
+            if child >= 0:
+                stack.append((int(child), depth + 1))
+        else:
+            for c in range(26):
+                if row[c] >= 0:
+                    stack.append((int(row[c]), depth + 1))
+    return matches
+
+
+def filter_by_letter(candidates, letter_index):
+    # Indices among candidates whose word contains letter_index (0-25).
+    return candidates[(WORDS_LETTERMASK[candidates] & np.uint32(1 << letter_index)) != 0]
+
+
+def pattern(guess, answer):
+    # Base-3 wordle feedback (0 grey, 1 yellow, 2 green) for one
+    # (guess, answer) pair of packed uint32s, two-pass green/yellow
+    # algorithm.  The constant-trip loops unroll in the JIT.
+    counts = np.zeros(26, dtype=np.uint8)
+    pat = 0
+    p3 = 1
+    for k in range(WORDLE_LENGTH):
+        gl = (guess >> (5 * k)) & 31
+        al = (answer >> (5 * k)) & 31
+        if gl == al:
+            pat += 2 * p3
+        else:
+            counts[al] += 1
+        p3 *= 3
+    p3 = 1
+    for k in range(WORDLE_LENGTH):
+        gl = (guess >> (5 * k)) & 31
+        al = (answer >> (5 * k)) & 31
+        if gl != al and counts[gl] > 0:
+            counts[gl] -= 1
+            pat += p3
+        p3 *= 3
+    return pat
+
+
+def _compute_patterns_kernel(words_u32, out):
+    n = words_u32.size
+    for gi in prange(n):
+        for ai in range(n):
+            out[gi, ai] = pattern(words_u32[gi], words_u32[ai])
+
+
+def _score_combos_kernel(word_masks, combo_masks, out):
+    # out[c] = number of words whose letters all lie inside combo c.
+    for c in prange(combo_masks.size):
+        outside = ~combo_masks[c]
+        count = 0
+        for w in range(word_masks.size):
+            if word_masks[w] & outside == 0:
+                count += 1
+        out[c] = count
+
+
+def _filter_candidates_kernel(words_u32, lettermask, greens_mask, greens_value,
+                              required, forbidden, out):
+    for i in prange(words_u32.size):
+        out[i] = ((words_u32[i] & greens_mask) == greens_value
+                  and (lettermask[i] & required) == required
+                  and (lettermask[i] & forbidden) == 0)
+
+
+if njit is not None:
+    # Eager signature so the compile cost is paid at import, cached on disk.
+    pattern = njit("uint8(uint32, uint32)", cache=True)(pattern)
+    _compute_patterns_kernel = njit(parallel=True, cache=True)(_compute_patterns_kernel)
+    _score_combos_kernel = njit("void(uint32[:], uint32[:], int32[:])",
+                                parallel=True, cache=True)(_score_combos_kernel)
+    _filter_candidates_kernel = njit(parallel=True, cache=True)(_filter_candidates_kernel)
+
+
+def filter_candidates(greens_mask, greens_value, required, forbidden):
+    # Boolean mask over the word list applying all constraints at once:
+    # greens_mask/greens_value select known letters in the packed encoding,
+    # required/forbidden are 26-bit letter masks.  Fans out across cores
+    # under numba; falls back to one vectorized numpy expression without it.
+    out = np.empty(N_WORDS, dtype=np.bool_)
+    if njit is not None:
+        _filter_candidates_kernel(WORDS_U32, WORDS_LETTERMASK,
+                                  np.uint32(greens_mask), np.uint32(greens_value),
+                                  np.uint32(required), np.uint32(forbidden), out)
+    else:
+        np.logical_and((WORDS_U32 & np.uint32(greens_mask)) == np.uint32(greens_value),
+                       (WORDS_LETTERMASK & np.uint32(required)) == np.uint32(required),
+                       out=out)
+        out &= (WORDS_LETTERMASK & np.uint32(forbidden)) == 0
+    return out
+
+@lru_cache(maxsize=None)
+def _make_filter(greens, yellows, greys):
+    checks = [f"w[{pos}] == {char!r}" for pos, char in greens]
+    checks += [f"{char!r} in w" for char in yellows]
+    checks += [f"{char!r} not in w" for char in greys]
+    source = "def f(w): return " + (" and ".join(checks) or "True")
+    namespace = {}
+    exec(source, namespace)
+    return namespace["f"]
+
+
+def make_filter(greens=(), yellows=(), greys=()):
+    # Compile a str predicate specialized to one constraint set: the greens
+    # (position -> letter), yellows and greys are baked into the bytecode as
+    # constants instead of interpreted from a structure per word.  Compiled
+    # predicates are cached on the canonicalized constraint tuples.
+    greens = tuple(sorted((pos, char.upper()) for pos, char in dict(greens).items()))
+    yellows = tuple(sorted(char.upper() for char in yellows))
+    greys = tuple(sorted(char.upper() for char in greys))
+    return _make_filter(greens, yellows, greys)
+
+
+_PATTERNS = None
+
+
+def get_patterns():
+    # Dense N x N uint8 table of feedback patterns, computed once and
+    # persisted next to this file keyed on the word-list hash.
+    global _PATTERNS
+    if _PATTERNS is None:
+        import hashlib
+        list_hash = hashlib.sha1(WORD_BUF).hexdigest()[:12]
+        cache_path = os.path.join(os.path.dirname(__file__), f"patterns_{list_hash}.npy")
+        if os.path.exists(cache_path):
+            _PATTERNS = np.load(cache_path)
+        else:
+            _PATTERNS = np.empty((N_WORDS, N_WORDS), dtype=np.uint8)
+            _compute_patterns_kernel(WORDS_U32, _PATTERNS)
+            np.save(cache_path, _PATTERNS)
+    return _PATTERNS
+
+
+def word_at(i):
+    return WORD_BUF[WORDLE_LENGTH * i:WORDLE_LENGTH * (i + 1)].decode("ascii")
+
+
+def letter(i, k):
+    # Letter k of word i as an integer 0-25.
+    return LETTERS[WORDLE_LENGTH * i + k] - 65
+
+
+def is_legal_word(word):
+    return word.upper() in WORDS_SET
+
+
+def most_used_letters():
+    # The corpus is uppercased once at load, so no per-character case
+    # conversion (or per-letter corpus rescan) happens here.
+    if np is not None:
+        # bincount histograms the whole buffer in one vectorized C call.
+        counts = np.bincount(_ARR, minlength=91)[65:91].tolist()
+        dicto = {chr(65 + i): count for i, count in enumerate(counts)}
+    else:
+        # Flat fixed-size histogram: counts[b - 65] is one array load/store,
+        # with none of the hashing a dict (or Counter) pays per byte.
+        counts = [0] * 26
+        for b in LETTERS:
+            counts[b - 65] += 1
+        dicto = {chr(65 + i): count for i, count in enumerate(counts)}
+    return dict(sorted(dicto.items(), key=lambda item: item[1], reverse=True))
+
+
+def letters_to_mask(letters):
+    # 26-bit letter-present mask of a letter collection.
+    mask = 0
+    for c in letters:
+        mask |= 1 << (ord(c.upper()) - 65)
+    return mask
+
+
+def mask_to_letters(mask):
+    # Inverse of letters_to_mask: sorted tuple of the letters in a mask.
+    return tuple(chr(65 + i) for i in range(26) if mask & (1 << i))
+
+
+def count_valid_words(letters):
+    # How many words are spellable from letters.  A word qualifies iff its
+    # letter mask has no bit outside the combo mask, which vectorizes to one
+    # AND + compare over the whole uint32 array.
+    if np is None:
+        # Partial evaluation for the numpy-free path: bake the combo's
+        # complement mask into a compiled predicate as a constant, then run
+        # that over the precomputed word masks.
+        pred = eval(f"lambda m: (m & {~letters_to_mask(letters) & 0x3FFFFFF}) == 0")
+        return sum(map(pred, WORD_MASKS))
+    combo_mask = np.uint32(letters_to_mask(letters))
+    return int(np.count_nonzero((WORDS_LETTERMASK & ~combo_mask) == 0))
+
+
+@lru_cache(maxsize=None)
+def _list_of_valid_words(letter_set):
+    # letter_set is a canonical frozenset of uppercase letters, and the
+    # result a tuple, so repeat queries cost one cache probe.  issuperset
+    # walks each five-character word inside the C set implementation, so no
+    # per-word frozensets are needed at all.
+    return tuple(word for word in words if letter_set.issuperset(word))
+
+
+def list_of_valid_words(letters):
+    # Case is resolved once here; the corpus is uppercase by construction and
+    # pre-deduplicated, so no per-letter .upper() or seen-before scan remains.
+    return list(_list_of_valid_words(frozenset(c.upper() for c in letters)))
+
+
+def _score_combo_chunk(chunk):
+    # Worker for the multiprocessing path: scores one shard of combos.  The
+    # word data is read from module globals, which a forked worker shares
+    # copy-on-write instead of repickling per task.
+    return [(combo, count_valid_words(combo)) for combo in chunk]
+
+
+def rearrange_words_by_uniqueness(legal_words):
+    # One walk, picking each word's destination list as it passes; words
+    # with five distinct letters sort to the front.
+    unique_words = []
+    duplicate_words = []
+    for word in legal_words:
+        (unique_words if len(set(word)) == WORDLE_LENGTH
+         else duplicate_words).append(word)
+    return unique_words + duplicate_words, len(unique_words)
+
+
+def print_valid_words(letters, items_per_row=10):
+    import random
+    # random.sample shuffles into a fresh list, so the partition pass below
+    # is the only traversal of the shuffled order.
+    legal_words = list_of_valid_words(letters)
+    legal_words, num_unique = rearrange_words_by_uniqueness(
+        random.sample(legal_words, len(legal_words)))
+    # Assemble the whole initializer and emit it with one write instead of
+    # a print call per word plus one per row.
+    header = ("static const char _valid_letters[] = \"" + "".join(sorted(letters)) + "\";\n"
+              f"#define WORDLE_NUM_VALID_WORDS {len(legal_words)}\n"
+              f"#define WORDLE_NUM_UNIQUE_WORDS {num_unique}\n"
+              "static const char _valid_words[][WORDLE_LENGTH + 1] = {\n")
+    rows = ("    " + "".join(f"\"{word}\", " for word in legal_words[i:i + items_per_row])
+            for i in range(0, len(legal_words), items_per_row))
+    sys.stdout.write(header + "\n".join(rows) + "\n};\n")
+
+
+def txt_of_all_letter_combos(num_letters_in_set, legal_letters, processes=1):
+    # processes only matters without numba: the sweep is embarrassingly
+    # parallel, so shard it over a pool (processes=None takes every core).
+    import itertools
+    import math
+    import time
+    # Never materialize every combination at once: the count comes from
+    # math.comb and the sweep streams tiles off the iterator, so peak memory
+    # is one tile regardless of C(n, k).
+    len_all_combos = math.comb(len(legal_letters), num_letters_in_set)
+    all_combos = itertools.combinations(legal_letters, num_letters_in_set)
+    time_start = time.time()
+    if np is not None:
+        # Struct-of-arrays result: one uint32 mask and one int32 count per
+        # combo instead of a dict of tuple keys, an order of magnitude less
+        # memory and a single argsort at the end.
+        combo_masks = np.empty(len_all_combos, dtype=np.uint32)
+        combo_counts = np.empty(len_all_combos, dtype=np.int32)
+        tile = 4096
+        done = 0
+        while True:
+            tile_combos = list(itertools.islice(all_combos, tile))
+            if not tile_combos:
+                break
+            masks = np.fromiter((letters_to_mask(combo) for combo in tile_combos),
+                                dtype=np.uint32, count=len(tile_combos))
+            if njit is not None:
+                # Compiled AND/compare loop fanned out over all cores.
+                counts = np.empty(masks.size, dtype=np.int32)
+                _score_combos_kernel(WORDS_LETTERMASK, masks, counts)
+            else:
+                # One broadcast AND + compare scores the whole tile against
+                # every word; tiling caps the boolean intermediate.
+                counts = ((WORDS_LETTERMASK[None, :] & ~masks[:, None]) == 0).sum(axis=1)
+            combo_masks[done:done + masks.size] = masks
+            combo_counts[done:done + masks.size] = counts
+            done += masks.size
+            time_elapsed = time.time() - time_start
+            time_left = time_elapsed * (len_all_combos - done) / done
+            print(f"{done} of {len_all_combos}  Est. time left: {time_left:.0f}s")
+    elif processes is None or processes > 1:
+        import multiprocessing as mp
+        n_shards = (processes or mp.cpu_count()) * 8
+        shard_len = max(1, -(-len_all_combos // n_shards))
+        shards = iter(lambda: list(itertools.islice(all_combos, shard_len)), [])
+        dict_combos_counts = {}
+        with mp.Pool(processes) as pool:
+            for shard in pool.imap_unordered(_score_combo_chunk, shards):
+                for combo, count in shard:
+                    dict_combos_counts[tuple(sorted(combo))] = count
+    else:
+        dict_combos_counts = {}
+        # Progress gate on a power-of-two mask: one AND + well-predicted
+        # branch per iteration, with no separate counter to bump and reset.
+        to_print_mask = 0x3FF
+        for i, letters in enumerate(all_combos):
+            if i and (i & to_print_mask) == 0:
+                time_elapsed = time.time() - time_start
+                time_left = time_elapsed * (len_all_combos - i) / i
+                print(f"{i} of {len_all_combos}  Est. time left: {time_left:.0f}s")
+            dict_combos_counts[tuple(sorted(letters))] = count_valid_words(letters)
+    # The winner only needs an O(n) max; the full sort happens just once,
+    # streaming straight into the ranking file.  Letters are decoded from the
+    # masks only at this output boundary.
+    if np is not None:
+        order = np.argsort(-combo_counts, kind="stable")
+        most_common_key = mask_to_letters(int(combo_masks[order[0]]))
+        ranking = ((mask_to_letters(int(combo_masks[i])), int(combo_counts[i]))
+                   for i in order)
+    else:
+        most_common_key, _ = max(dict_combos_counts.items(), key=lambda item: item[1])
+        ranking = sorted(dict_combos_counts.items(),
+                         key=lambda item: item[1], reverse=True)
+    # One pre-encoded write instead of a formatted write per combo; binary
+    # mode skips the text layer's newline translation.
+    with open("output.txt", "wb") as file:
+        file.write("\n".join(f"{list(key)}: {value}"
+                             for key, value in ranking).encode("ascii") + b"\n")
+    print_valid_words(list(most_common_key))
+
+
+if __name__ == "__main__":
+    legal_letters = [chr(65 + i) for i in range(26) if chr(65 + i) not in {"Q", "Z"}]
+    txt_of_all_letter_combos(10, legal_letters)